@@ -0,0 +1,30 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+
+class AdminCog(commands.Cog, name="Admin"):
+    """Operator commands for managing the bot itself."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="reload-cogs",
+        description="Force an immediate rescan of the cogs directory.",
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def reload_cogs(self, interaction: discord.Interaction):
+        """Wake the cog watcher so edits are picked up without the poll delay."""
+        rescan = getattr(self.bot, "request_cog_rescan", None)
+        if rescan is None:
+            await interaction.response.send_message(
+                "This bot has no cog watcher.", ephemeral=True
+            )
+            return
+        rescan()
+        await interaction.response.send_message("Rescanning cogs…", ephemeral=True)
+
+
+async def setup(bot):
+    await bot.add_cog(AdminCog(bot))
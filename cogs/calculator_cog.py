@@ -1,8 +1,55 @@
-import discord
+import ast
+import functools
+import types
+
 from discord.ext import commands
-from discord import app_commands
 import operator
 
+# Deletion table that strips every allowed character; anything left over
+# after translate() is a disallowed character. One C-level pass, no
+# Python-level loop.
+_DEL_ALLOWED = str.maketrans("", "", "0123456789.+-*/%^() ")
+
+# AST node types allowed in a calculator expression. Anything else
+# (names, calls, attribute access, etc.) is rejected before compilation.
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+
+class _ExprValidator(ast.NodeVisitor):
+    """Rejects any AST node outside the arithmetic whitelist."""
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError("Only numeric constants are allowed")
+        super().generic_visit(node)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr: str) -> types.CodeType:
+    """Parse, validate, and compile an arithmetic expression.
+
+    The result is cached per expression string, so repeated invocations of
+    the same expression skip parsing and validation entirely.
+    """
+    tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    _ExprValidator().visit(tree)
+    return compile(tree, "<calc>", "eval")
+
 
 class CalculatorCog(commands.Cog):
     def __init__(self, bot):
@@ -16,34 +63,29 @@ class CalculatorCog(commands.Cog):
             "^": operator.pow,
         }
 
-    @app_commands.command(name="calc", description="Performs a simple calculation.")
-    async def calculate(self, interaction: discord.Interaction, expression: str):
+    @commands.hybrid_command(name="calc", description="Performs a simple calculation.")
+    async def calculate(self, ctx: commands.Context, *, expression: str):
         """
         Performs a simple calculation.
         Example: /calc 5+3*2
         """
+        if expression.translate(_DEL_ALLOWED):
+            await ctx.send(
+                "Invalid characters detected in the expression. Only digits, basic operators (+-*/%^), parentheses, and spaces are allowed."
+            )
+            return
+
         try:
-            # Basic sanitization: only allow digits, operators, parentheses, and spaces
-            allowed_chars = "0123456789.+-*/%^() "
-            if not all(c in allowed_chars for c in expression):
-                await interaction.response.send_message(
-                    "Invalid characters detected in the expression. Only digits, basic operators (+-*/%^), parentheses, and spaces are allowed."
-                )
-                return
-
-            # Evaluate the expression
-            # WARNING: Using eval() can be dangerous if input is not strictly controlled.
-            # For a simple calculator, with the above sanitization, it's generally acceptable
-            # for basic arithmetic. For more complex/secure applications, a dedicated
-            # math expression parser library (e.g., SymPy, asteval) should be used.
-            result = eval(expression)
-            await interaction.response.send_message(f"Result: `{expression} = {result}`")
-        except SyntaxError:
-            await interaction.response.send_message("Invalid expression syntax. Please check your input.")
+            # Compile via the validated per-expression cache, then evaluate
+            # the code object with empty globals so nothing can leak in.
+            result = eval(_compile_expr(expression), {"__builtins__": {}}, {})
+            await ctx.send(f"Result: `{expression} = {result}`")
+        except (SyntaxError, ValueError):
+            await ctx.send("Invalid expression syntax. Please check your input.")
         except ZeroDivisionError:
-            await interaction.response.send_message("*explodes 💥*\n-# (you can't divide by zero)")
+            await ctx.send("*explodes 💥*\n-# (you can't divide by zero)")
         except Exception as e:
-            await interaction.response.send_message(f"An error occurred during calculation: `{e}`")
+            await ctx.send(f"An error occurred during calculation: `{e}`")
 
 
 async def setup(bot):
@@ -1,5 +1,5 @@
 from discord.ext import commands
-from discord import app_commands, Interaction
+from discord import app_commands
 
 
 class Hello(commands.Cog):
@@ -8,11 +8,11 @@ class Hello(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+    @commands.hybrid_command(name="hello", description="Says hello to you!")
     @app_commands.allowed_contexts(guilds=True, dms=True, private_channels=True)
-    @app_commands.command(name="hello", description="Says hello to you!")
-    async def hello(self, interaction: Interaction) -> None:
-        """A simple hello command usable as a slash command."""
-        await interaction.response.send_message(f"Hello, {interaction.user.mention} 👋")
+    async def hello(self, ctx: commands.Context) -> None:
+        """A simple hello command usable as a prefix or slash command."""
+        await ctx.send(f"Hello, {ctx.author.mention} 👋")
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -1,6 +1,4 @@
-import discord
 from discord.ext import commands
-from discord import app_commands
 
 
 class PingCog(commands.Cog, name="Ping"):
@@ -9,11 +7,11 @@ class PingCog(commands.Cog, name="Ping"):
     def __init__(self, bot):
         self.bot = bot
 
-    @app_commands.command(name="ping", description="Check the bot's response time")
-    async def ping(self, interaction: discord.Interaction):
+    @commands.hybrid_command(name="ping", description="Check the bot's response time")
+    async def ping(self, ctx: commands.Context):
         """Check the bot's response time."""
         latency = round(self.bot.latency * 1000)
-        await interaction.response.send_message(f"Pong! ^~^ Response time: {latency}ms")
+        await ctx.send(f"Pong! ^~^ Response time: {latency}ms")
 
 
 async def setup(bot):
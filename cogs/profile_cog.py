@@ -15,17 +15,20 @@ class ProfileCog(commands.Cog):
         if member is None:
             member = interaction.user
 
-        formats = ["png", "jpg", "webp"]
         embed = discord.Embed(title=f"{member.display_name}'s Avatar")
-        embed.set_image(url=member.avatar.url)
-
-        description = ""
-        for fmt in formats:
-            try:
-                avatar_url = member.avatar.replace(format=fmt).url
-                description += f"[{fmt.upper()}]({avatar_url})\n"
-            except Exception as e:
-                description += f"{fmt.upper()}: Error getting format - {e}\n"
+        embed.set_image(url=member.display_avatar.url)
+
+        avatar = member.avatar
+        if avatar is None:
+            description = "No custom avatar set."
+        else:
+            lines = []
+            for fmt in ("png", "jpg", "webp"):
+                try:
+                    lines.append(f"[{fmt.upper()}]({avatar.replace(format=fmt).url})")
+                except Exception as e:
+                    lines.append(f"{fmt.upper()}: Error getting format - {e}")
+            description = "\n".join(lines)
 
         embed.description = description
         await interaction.response.send_message(embed=embed)
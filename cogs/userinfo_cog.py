@@ -0,0 +1,326 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+import discord
+from discord.ext import commands
+from discord import app_commands, ui
+
+
+def _fmt_utc(dt):
+    """Format an aware UTC datetime as 'YYYY-MM-DD HH:MM:SS UTC'.
+
+    isoformat is a direct C call with no format-string parsing or locale
+    lookup, unlike strftime.
+    """
+    return dt.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds") + " UTC"
+
+
+# Sentinel for members whose joined_at is missing; built once at import
+# instead of per invocation.
+_DT_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
+
+# Notable permissions shown in /userinfo, as (bitmask, display name) pairs.
+# Testing against the raw Permissions.value avoids a descriptor lookup per
+# permission on every invocation.
+_KEY_PERMS = (
+    (discord.Permissions.administrator.flag, "Administrator"),
+    (discord.Permissions.manage_guild.flag, "Manage Server"),
+    (discord.Permissions.manage_channels.flag, "Manage Channels"),
+    (discord.Permissions.manage_roles.flag, "Manage Roles"),
+    (discord.Permissions.manage_messages.flag, "Manage Messages"),
+    (discord.Permissions.ban_members.flag, "Ban Members"),
+    (discord.Permissions.kick_members.flag, "Kick Members"),
+)
+
+# Status -> indicator emoji, shared by the per-device presence line.
+_DEVICE_MAP = {
+    discord.Status.online: "🟢",
+    discord.Status.idle: "🌙",
+    discord.Status.dnd: "⛔",
+    discord.Status.offline: "⚫",
+}
+
+# One formatter per activity type; keeps userinfo() to a single dict lookup
+# and makes new activity types a one-line addition.
+_ACTIVITY_FORMATTERS = {
+    discord.ActivityType.playing: lambda a: f"Playing {a.name}",
+    discord.ActivityType.streaming: lambda a: f"Streaming {a.name}",
+    # .title only exists on Spotify activities; other listening presences
+    # fall back to .name.
+    discord.ActivityType.listening: lambda a: f"Listening to {getattr(a, 'title', a.name)}…",
+    discord.ActivityType.watching: lambda a: f"Watching {a.name}",
+    discord.ActivityType.custom: lambda a: " ".join(
+        str(part) for part in (a.emoji, a.state) if part
+    ),
+}
+
+
+class UserInfoView(ui.LayoutView):
+    """Components-v2 layout for a single /userinfo response.
+
+    Defined at module scope so each invocation only constructs an instance;
+    all display strings are passed in explicitly rather than captured from
+    an enclosing scope.
+    """
+
+    def __init__(
+        self,
+        member,
+        *,
+        banner_asset,
+        username_discriminator,
+        created_at_str,
+        account_age_str,
+        avatar_type,
+        badges_str,
+        joined_at_str,
+        join_position_str,
+        boost_str,
+        top_role_str,
+        permissions_str,
+        timeout_str,
+        status_str,
+        device_status_str,
+        activity_str,
+        roles_count,
+        roles_str,
+    ):
+        super().__init__(timeout=None)
+        # Fuse adjacent text into a handful of multi-line blocks so the
+        # container holds a few TextDisplays instead of ~18.
+        blocks = [
+            f"# {member.display_name}",
+            "\n".join(
+                (
+                    f"**Username:** {username_discriminator}",
+                    f"**ID:** {member.id}",
+                    f"**Created:** {created_at_str}",
+                    f"**Account age:** {account_age_str}",
+                    f"**Avatar:** {avatar_type}",
+                    f"**Badges:** {badges_str}",
+                )
+            ),
+            "\n".join(
+                (
+                    f"**Joined:** {joined_at_str}",
+                    f"**Join position:** {join_position_str}",
+                    f"**Boost:** {boost_str}",
+                    f"**Top role:** {top_role_str}",
+                    f"**Key permissions:** {permissions_str}",
+                    f"**Timeout:** {timeout_str}",
+                )
+            ),
+            "\n".join(
+                (
+                    f"**Status:** {status_str}",
+                    f"**Devices:** {device_status_str}",
+                    f"**Activity:** {activity_str}",
+                    f"**Roles ({roles_count}):** {roles_str}",
+                )
+            ),
+        ]
+        items = [ui.TextDisplay(text) for text in blocks]
+        if banner_asset is not None:
+            items.append(ui.MediaGallery(discord.MediaGalleryItem(banner_asset.url)))
+        accent = member.color if isinstance(member, discord.Member) else None
+        self.add_item(ui.Container(*items, accent_color=accent))
+
+
+class UserInfoCog(commands.Cog):
+    """Cog for the /userinfo command."""
+
+    # How long a fetched banner (or its absence) stays valid, and how many
+    # users to remember before evicting the least recently used.
+    _BANNER_TTL = 600.0
+    _BANNER_CACHE_MAX = 1024
+
+    def __init__(self, bot):
+        self.bot = bot
+        # user id -> (monotonic fetch time, banner asset or None)
+        self._banner_cache: OrderedDict = OrderedDict()
+
+    @app_commands.command(
+        name="userinfo", description="Shows detailed information about a user."
+    )
+    async def userinfo(
+        self, interaction: discord.Interaction, member: Optional[discord.Member] = None
+    ):
+        """Shows detailed information about a user."""
+        # Member fetches and large-guild scans can push past Discord's 3 s
+        # interaction deadline; defer immediately and answer via followup.
+        await interaction.response.defer(thinking=True)
+        # interaction.guild/.user are available synchronously; no need to
+        # build a Context object just to read them.
+        guild = interaction.guild
+        if member is None:
+            # Guild invocations hand us a fully-populated Member already;
+            # no cache merge or fetch needed.
+            member = interaction.user
+        else:
+            cached = guild.get_member(member.id) if guild else None
+            if cached is not None:
+                member = cached
+
+        # Only hit the API when we hold a Member that is actually missing
+        # its guild data (e.g. from an unchunked guild).
+        if guild and isinstance(member, discord.Member) and member.joined_at is None:
+            try:
+                member = await guild.fetch_member(member.id)
+            except discord.HTTPException:
+                pass
+
+        now_utc = datetime.now(timezone.utc)
+
+        username_discriminator = str(member)
+        created_at_str = _fmt_utc(member.created_at)
+        years, rem_days = divmod((now_utc - member.created_at).days, 365)
+        account_age_str = f"{years} years, {rem_days // 30} months"
+        avatar_type = (
+            "Animated (GIF)"
+            if member.avatar and member.avatar.is_animated()
+            else "Static"
+        )
+
+        badges_str = (
+            ", ".join(
+                name.replace("_", " ").title()
+                for name, enabled in member.public_flags
+                if enabled
+            )
+            or "None"
+        )
+
+        is_member = isinstance(member, discord.Member)
+
+        if is_member and member.joined_at:
+            joined_at_str = _fmt_utc(member.joined_at)
+            # Single O(N) pass: count members who joined earlier (ties broken
+            # by id) instead of sorting the whole member list.
+            target_ts = member.joined_at
+            pos = 1
+            total = 0
+            for m in guild.members:
+                total += 1
+                mt = m.joined_at or _DT_MIN_UTC
+                if mt < target_ts or (mt == target_ts and m.id < member.id):
+                    pos += 1
+            join_position_str = f"{pos} of {total}"
+        else:
+            joined_at_str = "N/A"
+            join_position_str = "N/A"
+
+        boost_str = "Not boosting"
+        if is_member:
+            if member.premium_since:
+                months = (now_utc - member.premium_since).days // 30
+                boost_str = f"Boosting for {months} months"
+            else:
+                psr = guild.premium_subscriber_role if guild else None
+                if psr is not None:
+                    target_id = psr.id
+                    if any(r.id == target_id for r in member.roles):
+                        boost_str = "Boosting (time unknown)"
+
+        if is_member and guild:
+            top_role_str = member.top_role.mention
+            pv = member.guild_permissions.value
+            key_permissions = [name for mask, name in _KEY_PERMS if pv & mask]
+            permissions_str = ", ".join(key_permissions) or "None"
+            timeout_str = (
+                f"Until {_fmt_utc(member.timed_out_until)}"
+                if member.timed_out_until
+                else "Not timed out"
+            )
+        else:
+            top_role_str = "N/A"
+            permissions_str = "N/A"
+            timeout_str = "N/A"
+
+        if is_member:
+            status_str = str(member.status).title()
+            device_status_str = (
+                f"Desktop: {_DEVICE_MAP.get(member.desktop_status, '⚫')} "
+                f"Mobile: {_DEVICE_MAP.get(member.mobile_status, '⚫')} "
+                f"Web: {_DEVICE_MAP.get(member.web_status, '⚫')}"
+            )
+            act = member.activity
+            activity_str = (
+                _ACTIVITY_FORMATTERS.get(act.type, lambda a: "None")(act)
+                if act
+                else "None"
+            )
+        else:
+            status_str = "Unknown"
+            device_status_str = "Unknown"
+            activity_str = "None"
+
+        if is_member:
+            roles_count = sum(1 for r in member.roles if r.name != "@everyone")
+            # Stream mentions into a bounded buffer instead of joining every
+            # role and slicing; stop once the 1000-char display budget is hit.
+            buf = []
+            length = 0
+            for role in reversed(member.roles):
+                if role.name == "@everyone":
+                    continue
+                mention = role.mention
+                if length + len(mention) + 2 > 997:
+                    buf.append("...")
+                    break
+                buf.append(mention)
+                length += len(mention) + 2
+            roles_str = ", ".join(buf) if buf else "None"
+        else:
+            roles_str = "None"
+            roles_count = 0
+
+        # The user's profile banner is not included in member payloads; fetch
+        # the full user to get it, but remember the result (including "no
+        # banner") so repeat lookups skip the HTTP round-trip.
+        banner_asset = member.banner
+        if banner_asset is None:
+            # Explicit miss check: a timestamp default would read as a fresh
+            # hit whenever monotonic time is still below the TTL (i.e. the
+            # first minutes after boot) and then move_to_end a missing key.
+            entry = self._banner_cache.get(member.id)
+            if entry is not None and time.monotonic() - entry[0] < self._BANNER_TTL:
+                banner_asset = entry[1]
+                self._banner_cache.move_to_end(member.id)
+            else:
+                try:
+                    user = await self.bot.fetch_user(member.id)
+                    banner_asset = user.banner
+                except discord.HTTPException:
+                    banner_asset = None
+                self._banner_cache[member.id] = (time.monotonic(), banner_asset)
+                self._banner_cache.move_to_end(member.id)
+                if len(self._banner_cache) > self._BANNER_CACHE_MAX:
+                    self._banner_cache.popitem(last=False)
+
+        view = UserInfoView(
+            member,
+            banner_asset=banner_asset,
+            username_discriminator=username_discriminator,
+            created_at_str=created_at_str,
+            account_age_str=account_age_str,
+            avatar_type=avatar_type,
+            badges_str=badges_str,
+            joined_at_str=joined_at_str,
+            join_position_str=join_position_str,
+            boost_str=boost_str,
+            top_role_str=top_role_str,
+            permissions_str=permissions_str,
+            timeout_str=timeout_str,
+            status_str=status_str,
+            device_status_str=device_status_str,
+            activity_str=activity_str,
+            roles_count=roles_count,
+            roles_str=roles_str,
+        )
+        await interaction.followup.send(view=view)
+
+
+async def setup(bot):
+    await bot.add_cog(UserInfoCog(bot))
@@ -10,46 +10,174 @@ Responsibilities:
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib
+import importlib.util
+import logging
 import os
+import re
 import sys
-from typing import Optional, Dict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Dict, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:
+    # Rust-backed filesystem events (inotify/FSEvents/ReadDirectoryChangesW);
+    # optional, the watcher falls back to mtime polling without it.
+    from watchfiles import Change, PythonFilter, awatch
+except ImportError:
+    awatch = None
 
-def get_token() -> str:
+
+logger = logging.getLogger("tuffybot")
+
+# How long to wait after a change before syncing the command tree, so a
+# burst of file saves results in one sync instead of one per file.
+SYNC_DEBOUNCE_SECONDS = 0.5
+
+# Upper bound on extension (re)loads per poll tick. A mass change (e.g. a
+# git pull dropping dozens of cogs) is spread over several immediate ticks
+# instead of blocking the event loop for the whole batch.
+MAX_LOADS_PER_TICK = 8
+
+# Matches loadable cog filenames (*.py, not dunder/private "__" files);
+# bound to .match so the filter is one C call per name.
+_COG_RE = re.compile(r"^(?!__).+\.py\Z").match
+
+# Default contexts applied to cog app commands in add_cog; built once
+# instead of one AppCommandContext per command per (re)load.
+_DEFAULT_CTX = app_commands.AppCommandContext(
+    guild=True, dm_channel=True, private_channel=True
+)
+
+
+@dataclass(frozen=True)
+class BotConfig:
+    """Settings read from the environment / `.env` file."""
+
+    token: str
+    # Whether to run the cog watcher at all; production deployments where
+    # cogs never change on disk should set TUFFY_COG_WATCH=0.
+    watch_enabled: bool
+    # Poll interval (seconds) for the fallback watcher; irrelevant when
+    # filesystem events are in use.
+    watch_interval: float
+
+
+@functools.cache
+def _load_env() -> Mapping[str, str]:
+    """Parse `.env` once and return a read-only environment snapshot.
+
+    load_dotenv opens, reads, and parses the file on every call; callers
+    (including any future cog importing get_token) share this one parse.
+    """
     load_dotenv()
-    token = os.getenv("DISCORD_TOKEN")
+    return MappingProxyType(dict(os.environ))
+
+
+def get_config(token: Optional[str] = None) -> BotConfig:
+    env = _load_env()
+    token = token or env.get("DISCORD_TOKEN")
     if not token:
         raise RuntimeError(
             "DISCORD_TOKEN not found in environment. Please add it to a .env file."
         )
-    return token
+    try:
+        watch_interval = float(env.get("TUFFY_COG_WATCH_INTERVAL", "60"))
+    except ValueError:
+        watch_interval = 60.0
+    return BotConfig(
+        token=token,
+        watch_enabled=env.get("TUFFY_COG_WATCH", "1") != "0",
+        watch_interval=watch_interval,
+    )
+
+
+def get_token() -> str:
+    return get_config().token
 
 
 class TuffyBot(commands.Bot):
-    def __init__(self, command_prefix: str = "!") -> None:
+    # commands.Bot still carries a __dict__, but slotting our own fields
+    # turns the watcher's hot-loop attribute access into C-level offset
+    # loads instead of dict lookups.
+    __slots__ = (
+        "_cogs_dir",
+        "_cog_mtimes",
+        "_cog_index",
+        "_cog_watcher_task",
+        "_watch_force_polling",
+        "_watch_enabled",
+        "_watch_interval",
+        "_sync_pending",
+        "_sync_worker_task",
+        "_wake",
+        "_rescan_task",
+        "_last_snapshot_fingerprint",
+        "_loading",
+    )
+
+    def __init__(
+        self,
+        command_prefix: str = "!",
+        *,
+        force_polling: bool = False,
+        watch_enabled: bool = True,
+        watch_interval: float = 60.0,
+    ) -> None:
         intents = discord.Intents.all()
         super().__init__(
             command_prefix=command_prefix, intents=intents, help_command=None
         )
+        # Absolute path to the cogs directory, computed once
+        self._cogs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cogs")
         # Maps module name (e.g. "cogs.ping_cog") -> last modification time
         self._cog_mtimes: Dict[str, float] = {}
+        # Maps filename -> (module name, mtime) so the poll watcher only
+        # derives module-name strings for files it hasn't seen before
+        self._cog_index: Dict[str, Tuple[str, float]] = {}
         # Background task that watches the cogs directory for changes
         self._cog_watcher_task: Optional[asyncio.Task] = None
+        # Force mtime polling even when watchfiles is available (network mounts)
+        self._watch_force_polling = force_polling
+        # Whether to spawn the watcher at all, and how often the fallback polls
+        self._watch_enabled = watch_enabled
+        self._watch_interval = watch_interval
+        # Set by the watcher when the command tree needs a sync; drained by
+        # the debouncing _sync_worker task.
+        self._sync_pending = asyncio.Event()
+        self._sync_worker_task: Optional[asyncio.Task] = None
+        # Wakes the poll watcher early (e.g. from /reload-cogs) instead of
+        # waiting out the rest of the interval.
+        self._wake = asyncio.Event()
+        # One-shot rescan task spawned by request_cog_rescan when the poll
+        # watcher isn't running to consume the wake event.
+        self._rescan_task: Optional[asyncio.Task] = None
+        # Hash of the last (module, mtime) snapshot; lets quiet ticks skip
+        # the diff passes entirely.
+        self._last_snapshot_fingerprint: Optional[int] = None
+        # Serializes extension load/reload batches against tree syncs so a
+        # sync never runs while extensions are mid-load.
+        self._loading = asyncio.Lock()
 
     async def add_cog(self, cog: commands.Cog, *, override: bool = False) -> None:
         """Override add_cog to automatically apply allowed_contexts to all app commands."""
-        # Apply allowed_contexts to all app commands in the cog
-        for command in cog.__cog_app_commands__:
-            if isinstance(command, app_commands.Command):
-                # Only apply if not already set
-                command.allowed_contexts = app_commands.AppCommandContext(
-                    guild=True, dm_channel=True, private_channel=True
-                )
+        # Skip the scan entirely for cogs with no app commands (reloads of
+        # prefix-only cogs hit this path too).
+        if cog.__cog_app_commands__:
+            for command in cog.__cog_app_commands__:
+                # Only apply when the command (or an @allowed_contexts
+                # decorator on its callback) hasn't set contexts itself.
+                if (
+                    isinstance(command, app_commands.Command)
+                    and command.allowed_contexts is None
+                ):
+                    command.allowed_contexts = _DEFAULT_CTX
 
         # Call the parent add_cog method
         await super().add_cog(cog, override=override)
@@ -62,159 +190,407 @@ class TuffyBot(commands.Bot):
         except (
             Exception
         ) as exc:  # keep broad catch to avoid crashing on partial failures
-            print(f"Warning: failed to sync app commands: {exc}")
-        # Start the background watcher task after initial load/sync
-        if self._cog_watcher_task is None:
+            logger.warning("Failed to sync app commands: %s", exc)
+        # Start the background watcher task after initial load/sync; skipped
+        # entirely when disabled via TUFFY_COG_WATCH=0
+        if self._watch_enabled and self._cog_watcher_task is None:
             # create_task so it runs independently of setup_hook
-            self._cog_watcher_task = asyncio.create_task(self._cog_watcher())
+            self._cog_watcher_task = asyncio.create_task(
+                self._cog_watcher(interval=self._watch_interval)
+            )
+        if self._sync_worker_task is None:
+            self._sync_worker_task = asyncio.create_task(self._sync_worker())
 
     async def load_cogs(self) -> None:
         """Load all python files inside the cogs directory as extensions."""
-        cogs_dir = os.path.join(os.path.dirname(__file__), "cogs")
-        if not os.path.isdir(cogs_dir):
-            print("No cogs directory found; skipping cog loading.")
+        if not os.path.isdir(self._cogs_dir):
+            logger.warning("No cogs directory found; skipping cog loading.")
             return
 
-        for entry in sorted(os.listdir(cogs_dir)):
-            if not entry.endswith(".py") or entry.startswith("__"):
-                continue
-            module = f"cogs.{entry[:-3]}"
-            fullpath = os.path.join(cogs_dir, entry)
-            try:
-                mtime = os.path.getmtime(fullpath)
-            except Exception:
-                mtime = 0.0
-            try:
-                await self.load_extension(module)
-                print(f"Loaded cog: {module}")
-                # record the mtime even on success so the watcher has a baseline
-                self._cog_mtimes[module] = mtime
-            except Exception as exc:
-                print(f"Failed to load {module}: {exc}")
+        # The scandir/stat pass is synchronous filesystem work; run it in a
+        # worker thread so a slow disk can't stall the event loop.
+        modules = await asyncio.to_thread(self._list_cogs_sync)
+
+        # Load extensions concurrently so startup pays max-of-loads instead
+        # of sum-of-loads; return_exceptions keeps one bad cog from taking
+        # down the rest.
+        async with self._loading:
+            results = await asyncio.gather(
+                *(self.load_extension(module) for module, _ in modules),
+                return_exceptions=True,
+            )
+        for (module, mtime), result in zip(modules, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load %s: %s", module, result)
                 # still record mtime so changes will be detected later
                 self._cog_mtimes.setdefault(module, mtime)
+            else:
+                logger.info("Loaded cog: %s", module)
+                # record the mtime even on success so the watcher has a baseline
+                self._cog_mtimes[module] = mtime
+
+    def _list_cogs_sync(self) -> list[Tuple[str, float]]:
+        """Blocking scan of the cogs directory for load_cogs.
+
+        scandir hands back DirEntry objects whose stat() is served from the
+        directory read on Linux, so no extra getmtime syscall per file.
+        """
+        with os.scandir(self._cogs_dir) as it:
+            entries = sorted(
+                (
+                    e
+                    for e in it
+                    if e.is_file() and _COG_RE(e.name)
+                ),
+                key=lambda e: e.name,
+            )
+
+        modules = []  # (module name, mtime) in directory order
+        for entry in entries:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                mtime = 0.0
+            modules.append((f"cogs.{entry.name[:-3]}", mtime))
+        return modules
 
     async def on_ready(self) -> None:
         # Avoid referencing self.user attributes that may be None in some type-checkers;
         # At runtime this will be set.
         user = self.user
         if user is not None:
-            print(f"Logged in as {user} (ID: {user.id})")
+            logger.info("Logged in as %s (ID: %s)", user, user.id)
         else:
-            print("Bot is ready (user unknown)")
+            logger.info("Bot is ready (user unknown)")
 
-    async def _cog_watcher(self, interval: float = 1.0) -> None:
-        """Poll the `cogs/` directory and load/reload extensions when files change.
+    async def _cog_watcher(self, interval: float = 60.0) -> None:
+        """Watch the `cogs/` directory and load/reload extensions when files change.
 
-        This is a simple polling watcher (no external deps) intended to be robust
-        and easy to run in typical hosting environments.
+        Uses OS-native filesystem events (via watchfiles) when available so the
+        bot does zero work while idle; falls back to the original mtime polling
+        loop when watchfiles is not installed.
         """
-        cogs_dir = os.path.join(os.path.dirname(__file__), "cogs")
-        if not os.path.isdir(cogs_dir):
+        if not os.path.isdir(self._cogs_dir):
             return
 
         try:
-            while True:
-                # Build current map of py files -> mtime
-                current: Dict[str, float] = {}
-                for entry in sorted(os.listdir(cogs_dir)):
-                    if not entry.endswith(".py") or entry.startswith("__"):
-                        continue
-                    module = f"cogs.{entry[:-3]}"
-                    fullpath = os.path.join(cogs_dir, entry)
-                    try:
-                        current[module] = os.path.getmtime(fullpath)
-                    except Exception:
-                        current[module] = 0.0
-
-                # Detect added files
-                for module, mtime in current.items():
-                    if module not in self._cog_mtimes:
-                        # New cog file
-                        try:
-                            await self.load_extension(module)
-                            print(f"Watcher: loaded new cog {module}")
-                        except Exception as exc:
-                            print(f"Watcher: failed to load new cog {module}: {exc}")
-                        self._cog_mtimes[module] = mtime
-                        # Resync commands after changes
-                        try:
-                            await self.tree.sync()
-                        except Exception as exc:
-                            print(f"Watcher: failed to sync app commands: {exc}")
-
-                # Detect modified files
-                for module, mtime in current.items():
-                    prev = self._cog_mtimes.get(module)
-                    if prev is None:
-                        continue
-                    if mtime > prev:
-                        # File changed - reload if loaded, otherwise load
-                        try:
-                            if module in self.extensions:
-                                await self.reload_extension(module)
-                                print(f"Watcher: reloaded cog {module}")
-                            else:
-                                await self.load_extension(module)
-                                print(f"Watcher: loaded cog {module} (was not loaded)")
-                        except Exception as exc:
-                            print(f"Watcher: failed to reload/load {module}: {exc}")
-                        self._cog_mtimes[module] = mtime
-                        try:
-                            await self.tree.sync()
-                        except Exception as exc:
-                            print(f"Watcher: failed to sync app commands: {exc}")
-
-                # Detect removed files
-                removed = [m for m in list(self._cog_mtimes.keys()) if m not in current]
-                for module in removed:
-                    # Unload the extension if it's loaded
-                    try:
-                        if module in self.extensions:
-                            await self.unload_extension(module)
-                            print(f"Watcher: unloaded removed cog {module}")
-                    except Exception as exc:
-                        print(f"Watcher: failed to unload removed cog {module}: {exc}")
-                    self._cog_mtimes.pop(module, None)
-                    try:
-                        await self.tree.sync()
-                    except Exception as exc:
-                        print(f"Watcher: failed to sync app commands: {exc}")
-
-                await asyncio.sleep(interval)
+            if awatch is not None:
+                await self._event_watcher(interval)
+            else:
+                await self._poll_watcher(interval)
         except asyncio.CancelledError:
             # Expected during shutdown
             return
 
-    async def close(self) -> None:
-        # Cancel watcher task if running and wait for it to finish
-        task = getattr(self, "_cog_watcher_task", None)
-        if task is not None:
-            task.cancel()
+    async def _event_watcher(self, interval: float) -> None:
+        """Dispatch cog loads/reloads from filesystem events."""
+        kwargs = {}
+        if self._watch_force_polling:
+            # inotify/FSEvents don't fire on network mounts; fall back to
+            # watchfiles' internal polling with a long delay.
+            kwargs["force_polling"] = True
+            kwargs["poll_delay_ms"] = max(int(interval * 1000), 1)
+
+        # PythonFilter ignores editor temp files (.swp, ~, etc.) so they never
+        # trigger reload/sync work.
+        async for changes in awatch(
+            self._cogs_dir,
+            watch_filter=PythonFilter(),
+            recursive=False,
+            **kwargs,
+        ):
+            # Classify the batch first so import-cache work happens once.
+            to_load = []
+            to_reload = []
+            to_unload = []
+            for change, path in changes:
+                name = os.path.basename(path)
+                if not _COG_RE(name):
+                    continue
+                module = f"cogs.{name[:-3]}"
+                if change == Change.deleted:
+                    to_unload.append(module)
+                    continue
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    mtime = 0.0
+                if change == Change.added and module not in self._cog_mtimes:
+                    to_load.append((module, mtime))
+                else:
+                    to_reload.append((module, mtime))
+
+            # Events don't re-fire, so the whole batch is processed here;
+            # the sleep(0) after each load is the scheduling point that
+            # lets heartbeats run between extensions.
+            async with self._loading:
+                if to_load or to_reload:
+                    await self._prepare_imports(
+                        [m for m, _ in to_load] + [m for m, _ in to_reload]
+                    )
+                for module, mtime in to_load:
+                    await self._watcher_load(module, mtime)
+                    await asyncio.sleep(0)
+                for module, mtime in to_reload:
+                    await self._watcher_reload(module, mtime)
+                    await asyncio.sleep(0)
+                for module in to_unload:
+                    await self._watcher_unload(module)
+            if to_load or to_reload or to_unload:
+                self._request_sync()
+
+    def _scan_cogs_sync(self) -> Dict[str, float]:
+        """Blocking snapshot pass for the poll watcher; run via to_thread.
+
+        Builds the module -> mtime map from one scandir pass; DirEntry.stat()
+        is served from the directory read on Linux, so no second stat syscall
+        per file per tick.
+        """
+        current: Dict[str, float] = {}
+        with os.scandir(self._cogs_dir) as it:
+            entries = sorted(
+                (
+                    e for e in it if _COG_RE(e.name)
+                ),
+                key=lambda e: e.name,
+            )
+        index = self._cog_index
+        for entry in entries:
             try:
-                await task
-            except asyncio.CancelledError:
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+            except OSError:
+                mtime = 0.0
+            cached = index.get(entry.name)
+            if cached is None:
+                # First sighting: derive the module name once and cache it
+                module = f"cogs.{entry.name[:-3]}"
+                index[entry.name] = (module, mtime)
+            else:
+                module = cached[0]
+                if cached[1] != mtime:
+                    index[entry.name] = (module, mtime)
+            current[module] = mtime
+        # Forget filenames that no longer exist on disk
+        if len(index) != len(entries):
+            names = {e.name for e in entries}
+            for name in [n for n in index if n not in names]:
+                del index[name]
+        return current
+
+    async def _rescan_once(self) -> bool:
+        """One scan-and-diff pass over the cogs directory.
+
+        Returns True when the load work was capped at MAX_LOADS_PER_TICK and
+        another pass is needed to finish the batch.
+        """
+        # The stat storm runs in a worker thread so slow or networked
+        # filesystems can't stall gateway heartbeats.
+        current = await asyncio.to_thread(self._scan_cogs_sync)
+
+        # Fast path: if the snapshot matches the last fully-applied one,
+        # skip the diff passes entirely. current is built in sorted filename
+        # order, so the items tuple hashes deterministically.
+        fingerprint = hash(tuple(current.items()))
+        if fingerprint == self._last_snapshot_fingerprint:
+            return False
+
+        # Classify everything in one pass over current, then act.
+        work = []
+        for module, mtime in current.items():
+            prev = self._cog_mtimes.get(module)
+            if prev is None:
+                work.append((self._watcher_load, module, mtime))
+            elif mtime > prev:
+                work.append((self._watcher_reload, module, mtime))
+        # Removed files: C-level set difference on the key views
+        to_unload = self._cog_mtimes.keys() - current.keys()
+
+        # Cap the (re)load work done this pass. Leftover modules keep their
+        # stale entries in _cog_mtimes, so the immediate next pass
+        # re-detects and processes them.
+        carried = len(work) > MAX_LOADS_PER_TICK
+        if carried:
+            del work[MAX_LOADS_PER_TICK:]
+        else:
+            # Only remember the snapshot once it has been fully applied,
+            # so a carried-over pass can't be skipped.
+            self._last_snapshot_fingerprint = fingerprint
+
+        async with self._loading:
+            if work:
+                await self._prepare_imports([m for _, m, _ in work])
+            for handler, module, mtime in work:
+                await handler(module, mtime)
+                # Scheduling point: let heartbeats and interactions run
+                # between extension loads.
+                await asyncio.sleep(0)
+            for module in to_unload:
+                await self._watcher_unload(module)
+        if work or to_unload:
+            self._request_sync()
+        return carried
+
+    async def _poll_watcher(self, interval: float) -> None:
+        """Fallback watcher: compare mtimes on a fixed interval."""
+        while True:
+            if await self._rescan_once():
+                # Capped batch: go straight into the next pass instead of
+                # sleeping out the interval with work still pending.
+                continue
+
+            # Sleep until the interval elapses or something explicitly wakes
+            # us (operator rescan), whichever comes first.
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
                 pass
+            else:
+                self._wake.clear()
+
+    async def _prepare_imports(self, modules: list[str]) -> None:
+        """Invalidate import caches once per batch and pre-warm module specs.
+
+        find_spec stats sys.path entries, so it runs off-loop via to_thread
+        rather than stalling the gateway heartbeat.
+        """
+        importlib.invalidate_caches()
+
+        def warm() -> None:
+            for module in modules:
+                try:
+                    importlib.util.find_spec(module)
+                except (ImportError, ValueError):
+                    pass
+
+        await asyncio.to_thread(warm)
+
+    async def _watcher_load(self, module: str, mtime: float) -> None:
+        try:
+            await self.load_extension(module)
+            logger.info("Watcher: loaded new cog %s", module)
+        except (commands.ExtensionError, ImportError) as exc:
+            logger.error("Watcher: failed to load new cog %s: %s", module, exc)
+        self._cog_mtimes[module] = mtime
+
+    async def _watcher_reload(self, module: str, mtime: float) -> None:
+        # File changed - reload if loaded, otherwise load
+        try:
+            if module in self.extensions:
+                await self.reload_extension(module)
+                logger.info("Watcher: reloaded cog %s", module)
+            else:
+                await self.load_extension(module)
+                logger.info("Watcher: loaded cog %s (was not loaded)", module)
+        except (commands.ExtensionError, ImportError) as exc:
+            logger.error("Watcher: failed to reload/load %s: %s", module, exc)
+        self._cog_mtimes[module] = mtime
+
+    async def _watcher_unload(self, module: str) -> None:
+        # Unload the extension if it's loaded
+        try:
+            if module in self.extensions:
+                await self.unload_extension(module)
+                logger.info("Watcher: unloaded removed cog %s", module)
+        except commands.ExtensionError as exc:
+            logger.error("Watcher: failed to unload removed cog %s: %s", module, exc)
+        self._cog_mtimes.pop(module, None)
+
+    def request_cog_rescan(self) -> None:
+        """Trigger an immediate rescan of the cogs directory.
+
+        The poll watcher is woken from its interval sleep when it's what is
+        running. Under the event watcher (or with watching disabled) nothing
+        consumes the wake event, so a one-shot scan-and-diff task runs
+        instead — the recovery path for missed filesystem events.
+        """
+        if awatch is None and self._watch_enabled:
+            self._wake.set()
+            return
+        if self._rescan_task is None or self._rescan_task.done():
+            self._rescan_task = asyncio.create_task(self._drain_rescan())
+
+    async def _drain_rescan(self) -> None:
+        """Run scan-and-diff passes until a batch completes uncapped."""
+        while await self._rescan_once():
+            pass
+
+    def _request_sync(self) -> None:
+        """Ask the sync worker for a (debounced) command-tree sync."""
+        self._sync_pending.set()
+
+    async def _sync_worker(self) -> None:
+        """Coalesce sync requests: one tree.sync per burst of changes.
+
+        HTTP failures (rate limits, transient outages) are retried with
+        exponential backoff instead of being silently swallowed.
+        """
+        backoff = SYNC_DEBOUNCE_SECONDS
+        try:
+            while True:
+                await self._sync_pending.wait()
+                # Let the rest of the burst land before clearing and syncing.
+                await asyncio.sleep(SYNC_DEBOUNCE_SECONDS)
+                self._sync_pending.clear()
+                try:
+                    # Taking the loading lock guarantees no extension batch
+                    # is mid-flight while the tree is being serialized.
+                    async with self._loading:
+                        await self.tree.sync()
+                except discord.HTTPException as exc:
+                    logger.warning("Watcher: failed to sync app commands: %s", exc)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 60.0)
+                    self._sync_pending.set()
+                else:
+                    backoff = SYNC_DEBOUNCE_SECONDS
+        except asyncio.CancelledError:
+            return
+
+    async def close(self) -> None:
+        # Cancel background tasks if running and wait for them to finish
+        for attr in ("_cog_watcher_task", "_sync_worker_task", "_rescan_task"):
+            task = getattr(self, attr, None)
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         await super().close()
 
 
-async def main(token: Optional[str] = None) -> None:
-    token = token or get_token()
-    bot = TuffyBot()
+async def main(token: Optional[str] = None, *, force_polling: bool = False) -> None:
+    # Configure logging once at startup; no-op if the host app already did.
+    logging.basicConfig(
+        level=_load_env().get("TUFFY_LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    config = get_config(token)
+    bot = TuffyBot(
+        force_polling=force_polling,
+        watch_enabled=config.watch_enabled,
+        watch_interval=config.watch_interval,
+    )
+    token = config.token
 
     try:
         async with bot:
             await bot.start(token)
     except KeyboardInterrupt:
-        print("Received exit, logging out...")
+        logger.info("Received exit, logging out...")
         await bot.close()
     except Exception:
-        # Print exception to stderr for CI/hosting visibility then re-raise
-        print("Unhandled exception while running the bot:", file=sys.stderr)
+        # Log for CI/hosting visibility then re-raise
+        logger.error("Unhandled exception while running the bot:")
         raise
 
 
 if __name__ == "__main__":
-    # Allow passing a token as the first CLI arg for quick testing (optional)
-    cli_token: Optional[str] = sys.argv[1] if len(sys.argv) > 1 else None
-    asyncio.run(main(cli_token))
+    # Allow passing a token as the first CLI arg for quick testing (optional).
+    # --poll forces mtime polling for filesystems without inotify (e.g. NFS).
+    args = sys.argv[1:]
+    poll_flag = "--poll" in args
+    if poll_flag:
+        args.remove("--poll")
+    cli_token: Optional[str] = args[0] if args else None
+    asyncio.run(main(cli_token, force_polling=poll_flag))